@@ -14,82 +14,96 @@ license : MIT
 # IMPORTS
 import os
 import sys
-from functools import partial
+from functools import lru_cache, partial
+from typing import Optional
 from PyQt5.QtWidgets import (QApplication, QWidget, QPushButton, QLabel,
-                             QVBoxLayout, QHBoxLayout, QGridLayout,
+                             QVBoxLayout, QHBoxLayout, QGridLayout, QLayout,
                              QMainWindow, QFrame, QMessageBox, QStackedWidget)
 
 from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QFont, QFontDatabase, QColor, QPalette, QIcon
+from PyQt5.QtGui import QFont, QColor, QPalette, QIcon
+
+
+# Resolve the window icon once, from the first available ICO file
+_BASE_DIR: str = os.path.dirname(os.path.abspath(__file__))
+_ICON_LOCATIONS: tuple[str, ...] = (os.path.join(_BASE_DIR, 'images', 'icon.ico'),
+                                    os.path.join(_BASE_DIR, 'icon.ico'))
+_ICON: Optional[str] = next((path for path in _ICON_LOCATIONS if os.path.isfile(path)), None)
+
+
+@lru_cache(maxsize=None)
+def _monospace_font(size: int, bold: bool = False) -> QFont:
+    """Return the shared monospace QFont for `size`, built on first use"""
+    return QFont('Monospace', size, QFont.Bold) if bold else QFont('Monospace', size)
+
+
+# Stylesheet templates, filled in once with the color scheme via str.format
+_CARD_QSS: str = """
+    NumberCard {{
+        background-color: {card_background};
+        border: 3px solid {primary};
+        border-radius: 10px;
+    }}
+
+    NumberCard QLabel {{
+        color: {primary};
+        background-color: {card_number_background};
+        border: 1px solid {secondary};
+        border-radius: 5px;
+        padding: 4px;
+        min-width: 30px;
+    }}
+"""
+
+_BUTTON_QSS: str = """
+    QPushButton {{
+        color: {primary};
+        border: 3px solid {primary};
+        border-radius: 10px;
+        background-color: {secondary};
+        font-size: {font_size}pt;
+        font-weight: bold;
+    }}
+
+    QPushButton:hover {{
+        color: {text_light};
+        border-color: {text_light};
+        background-color: {primary};
+    }}
+"""
 
 
 class NumberCard(QFrame):
     """Widget representing a card of numbers"""
 
-    def __init__(self, numbers, colors, parent=None) -> None:
+    # Max 8 numbers per row
+    COLUMNS: int = 8
+
+    def __init__(self, colors, parent=None) -> None:
         super(NumberCard, self).__init__(parent)
 
-        # Set frame styling
+        # Set frame styling (also styles the number labels through the child selector)
         self.setFrameShape(QFrame.StyledPanel)
         self.setLineWidth(2)
-        self.setStyleSheet(f"""
-            NumberCard {{
-                background-color: {colors['card_background']};
-                border: 3px solid {colors['primary']};
-                border-radius: 10px;
-            }}
-        """)
+        self.setStyleSheet(_CARD_QSS.format(**colors))
 
         # Create grid layout for numbers
-        grid = QGridLayout(self)
-        grid.setSpacing(8)
-
-        # Calculate optimal grid dimensions
-        count: int = len(numbers)
-        cols: int = min(8, count)  # Max 8 numbers per row
-
-        # Add number labels to grid
-        for i, num in enumerate(numbers):
-            row, col = divmod(i, cols)
-            label = QLabel(num)
-            label.setAlignment(Qt.AlignCenter)
-            label.setFont(QFont('Monospace', 16))
-            label.setStyleSheet(f"""
-                color: {colors['primary']};
-                background-color: {colors['card_number_background']};
-                border: 1px solid {colors['secondary']};
-                border-radius: 5px;
-                padding: 4px;
-                min-width: 30px;
-            """)
-            grid.addWidget(label, row, col)
+        self._grid = QGridLayout(self)
+        self._grid.setSpacing(8)
+        self._grid.setSizeConstraint(QLayout.SetMinimumSize)
+
+    def add_label(self, text: str) -> None:
+        """Append a number label to the next free cell of the grid"""
+
+        label = QLabel(text)
+        label.setAlignment(Qt.AlignCenter)
+        label.setFont(_monospace_font(16))
+        self._grid.addWidget(label, *divmod(self._grid.count(), self.COLUMNS))
 
 
 class GuessTheNumberGame(QMainWindow):
     """Main game window with improved GUI and game logic"""
 
-    # Define card numbers
-    CARDS_NUMS: list[list] = [
-        list(map(str,
-                 [1, 3, 5, 7, 9, 11, 13, 15, 17, 19, 21, 23, 25, 27, 29, 31, 33, 35, 37, 39, 41, 43, 45, 47, 49, 51, 53,
-                  55, 57, 59, 61, 63])),
-        list(map(str,
-                 [2, 3, 6, 7, 10, 11, 14, 15, 18, 19, 22, 23, 26, 27, 30, 31, 34, 35, 38, 39, 42, 43, 46, 47, 50, 51,
-                  54, 55, 58, 59, 62, 63])),
-        list(map(str,
-                 [4, 5, 6, 7, 12, 13, 14, 15, 20, 21, 22, 23, 28, 29, 30, 31, 36, 37, 38, 39, 44, 45, 46, 47, 52, 53,
-                  54, 55, 60, 61, 62, 63])),
-        list(map(str,
-                 [8, 9, 10, 11, 12, 13, 14, 15, 24, 25, 26, 27, 28, 29, 30, 31, 40, 41, 42, 43, 44, 45, 46, 47, 56, 57,
-                  58, 59, 60, 61, 62, 63])),
-        list(map(str,
-                 [16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 48, 49, 50, 51, 52, 53, 54, 55, 56,
-                  57, 58, 59, 60, 61, 62, 63])),
-        list(map(str,
-                 [32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56,
-                  57, 58, 59, 60, 61, 62, 63]))
-    ]
-
     # Color scheme with more consistent naming
     COLORS: dict[str, str] = {
         'background': '#e0e0ff',
@@ -102,6 +116,9 @@ class GuessTheNumberGame(QMainWindow):
         'card_number_background': '#d8d8ff'
     }
 
+    # Color scheme as QColor objects, built once for the palette
+    _QCOLORS: dict[str, QColor] = {name: QColor(value) for name, value in COLORS.items()}
+
     # Screen indices for stacked widget
     MAIN_MENU: int = 0
     INTRODUCTION: int = 1
@@ -115,19 +132,15 @@ class GuessTheNumberGame(QMainWindow):
         self.answer: str = ''
         self.card_num: int = 0
 
-        # Set window icon from the first available ICO file
-        base_dir: str = os.path.dirname(os.path.abspath(__file__))
-        icon_locations: list[tuple[int, int]] = [
-            os.path.join(base_dir, 'images', 'icon.ico'),
-            os.path.join(base_dir, 'icon.ico'),
+        # Button stylesheets keyed by font size, the only value that varies between them
+        self._button_qss: dict[int, str] = {
+            font_size: _BUTTON_QSS.format(font_size=font_size, **self.COLORS)
+            for font_size in (14, 16)
+        }
 
-        ]
-
-        # Set valid icon found
-        for icon_path in icon_locations:
-            if os.path.isfile(icon_path):
-                self.setWindowIcon(QIcon(icon_path))
-                break
+        # Set window icon if one was found
+        if _ICON:
+            self.setWindowIcon(QIcon(_ICON))
 
         # Set window properties
         self.setWindowTitle('Guess The Number')
@@ -157,10 +170,10 @@ class GuessTheNumberGame(QMainWindow):
 
         # Set color scheme
         palette: QPalette = QPalette()
-        palette.setColor(QPalette.Window, QColor(self.COLORS['background']))
-        palette.setColor(QPalette.WindowText, QColor(self.COLORS['text']))
-        palette.setColor(QPalette.Button, QColor(self.COLORS['secondary']))
-        palette.setColor(QPalette.ButtonText, QColor(self.COLORS['primary']))
+        palette.setColor(QPalette.Window, self._QCOLORS['background'])
+        palette.setColor(QPalette.WindowText, self._QCOLORS['text'])
+        palette.setColor(QPalette.Button, self._QCOLORS['secondary'])
+        palette.setColor(QPalette.ButtonText, self._QCOLORS['primary'])
         self.setPalette(palette)
         self.setAutoFillBackground(True)
 
@@ -169,24 +182,14 @@ class GuessTheNumberGame(QMainWindow):
 
         button = QPushButton(text)
         button.setFixedSize(width, height)
-        button.setFont(QFont('Monospace', font_size))
+        button.setFont(_monospace_font(font_size))
         button.setCursor(Qt.PointingHandCursor)
-        button.setStyleSheet(f"""
-            QPushButton {{
-                color: {self.COLORS["primary"]};
-                border: 3px solid {self.COLORS["primary"]};
-                border-radius: 10px;
-                background-color: {self.COLORS["secondary"]};
-                font-size: {font_size}pt;
-                font-weight: bold;
-            }}
-
-            QPushButton:hover {{
-                color: {self.COLORS["text_light"]};
-                border-color: {self.COLORS["text_light"]};
-                background-color: {self.COLORS["primary"]};
-            }}
-        """)
+
+        # Reuse the cached stylesheet, formatting it only for an unseen font size
+        qss: str = self._button_qss.get(font_size)
+        if qss is None:
+            qss = self._button_qss[font_size] = _BUTTON_QSS.format(font_size=font_size, **self.COLORS)
+        button.setStyleSheet(qss)
         button.clicked.connect(onclick)
         return button
 
@@ -199,13 +202,11 @@ class GuessTheNumberGame(QMainWindow):
         # Introduction screen
         self.init_introduction_screen()
 
-        # Game screen (will be updated during gameplay)
-        self.game_screen = QWidget()
-        self.stacked_widget.addWidget(self.game_screen)
+        # Game screen (pre-built, with one card page per card)
+        self.init_game_screen()
 
-        # Result screen (will be updated at the end)
-        self.result_screen = QWidget()
-        self.stacked_widget.addWidget(self.result_screen)
+        # Result screen (only the result label changes between games)
+        self.init_result_screen()
 
     def init_main_menu(self) -> None:
         """Initialize the main menu screen"""
@@ -217,7 +218,7 @@ class GuessTheNumberGame(QMainWindow):
 
         # Add logo
         logo = QLabel('Guess The Number')
-        logo.setFont(QFont('Monospace', 32, QFont.Bold))
+        logo.setFont(_monospace_font(32, bold=True))
         logo.setStyleSheet(f'color: {self.COLORS["primary"]}')
         logo.setAlignment(Qt.AlignCenter)
         layout.addWidget(logo)
@@ -239,7 +240,7 @@ class GuessTheNumberGame(QMainWindow):
         # Add credits at bottom
         credits = QLabel('Developed By Aymen Brahim Djelloul')
         credits.setStyleSheet(f'color: {self.COLORS["accent"]}')
-        credits.setFont(QFont('Monospace', 10))
+        credits.setFont(_monospace_font(10))
         credits.setAlignment(Qt.AlignCenter)
         layout.addWidget(credits)
 
@@ -254,7 +255,7 @@ class GuessTheNumberGame(QMainWindow):
 
         # Header
         header = QLabel('How to Play', intro_screen)
-        header.setFont(QFont('Monospace', 24, QFont.Bold))
+        header.setFont(_monospace_font(24, bold=True))
         header.setStyleSheet(f'color: {self.COLORS["primary"]}')
         header.setAlignment(Qt.AlignCenter)
         layout.addWidget(header)
@@ -266,7 +267,7 @@ class GuessTheNumberGame(QMainWindow):
             "3. For each card, tell me if your number is on it.\n\n"
             "4. At the end, I'll guess your number!", intro_screen
         )
-        instructions.setFont(QFont('Monospace', 14))
+        instructions.setFont(_monospace_font(14))
         instructions.setStyleSheet(f'color: {self.COLORS["text"]}')
         instructions.setAlignment(Qt.AlignCenter)
         layout.addWidget(instructions)
@@ -277,41 +278,44 @@ class GuessTheNumberGame(QMainWindow):
 
         self.stacked_widget.addWidget(intro_screen)
 
-    def start_game(self) -> None:
-        """Start a new game"""
-
-        # Reset game state
-        self.answers: str = ''
-        self.card_num: int = 0
+    def init_game_screen(self) -> None:
+        """Initialize the game screen, whose card area holds a page for each of the six cards"""
 
-        # Show introduction screen
-        self.stacked_widget.setCurrentIndex(self.INTRODUCTION)
-
-    def update_game_screen(self) -> None:
-        """Update the game screen with the current card"""
-
-        # Create a new widget for the game screen
         game_widget: QWidget = QWidget()
         layout = QVBoxLayout(game_widget)
         layout.setSpacing(15)
 
-        # Add card number indicator
-        progress = QLabel(f"Card {self.card_num + 1} of 6")
-        progress.setFont(QFont('Monospace', 12))
-        progress.setStyleSheet(f'color: {self.COLORS["accent"]}')
-        progress.setAlignment(Qt.AlignCenter)
-        layout.addWidget(progress)
+        # Add card number indicator (text is set by update_game_screen)
+        self._progress_label = QLabel()
+        self._progress_label.setFont(_monospace_font(12))
+        self._progress_label.setStyleSheet(f'color: {self.COLORS["accent"]}')
+        self._progress_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self._progress_label)
 
         # Add question
         question = QLabel("Is your number on this card?")
-        question.setFont(QFont('Monospace', 16))
+        question.setFont(_monospace_font(16))
         question.setStyleSheet(f'color: {self.COLORS["primary"]}')
         question.setAlignment(Qt.AlignCenter)
         layout.addWidget(question)
 
-        # Create number card
-        card = NumberCard(self.CARDS_NUMS[self.card_num], self.COLORS)
-        layout.addWidget(card)
+        # Create number cards, only the current one is shown
+        self.game_stack: QStackedWidget = QStackedWidget()
+        self._cards: list[NumberCard] = [NumberCard(self.COLORS) for _ in range(6)]
+        for card in self._cards:
+            self.game_stack.addWidget(card)
+
+        # Card i holds every number with bit i set, filled in a single pass
+        # while updates are held back until all labels are in place
+        self.game_stack.setUpdatesEnabled(False)
+        for n in range(1, 64):
+            text: str = str(n)
+            for card_index, card in enumerate(self._cards):
+                if n & (1 << card_index):
+                    card.add_label(text)
+        self.game_stack.setUpdatesEnabled(True)
+
+        layout.addWidget(self.game_stack)
 
         # Add yes/no buttons
         button_layout = QHBoxLayout()
@@ -327,73 +331,39 @@ class GuessTheNumberGame(QMainWindow):
 
         layout.addLayout(button_layout)
 
-        # Replace the existing game screen with the new one
-        old_widget = self.stacked_widget.widget(self.GAME)
-        self.stacked_widget.removeWidget(old_widget)
-        old_widget.deleteLater()
-
-        self.stacked_widget.insertWidget(self.GAME, game_widget)
-        self.stacked_widget.setCurrentIndex(self.GAME)
-
-    def show_next_card(self) -> None:
-        """Show the next card of numbers"""
-
-        # Check if we have shown all cards
-        if self.card_num >= 6:
-            self.update_result_screen()
-            self.stacked_widget.setCurrentIndex(self.RESULT)
-            return
-
-        # Update the game screen with current card
-        self.update_game_screen()
-
-    def process_answer(self, answer: int) -> None:
-        """Process the user's answer"""
-
-        # Add answer to binary string
-        self.answers += answer
-        self.card_num += 1
-
-        # Show transition effect with proper timer
-        self.centralWidget().setEnabled(False)
-        QTimer.singleShot(50, self.show_next_card)
-        QTimer.singleShot(50, lambda: self.centralWidget().setEnabled(True))
+        self.stacked_widget.addWidget(game_widget)
 
-    def update_result_screen(self) -> None:
-        """Update the result screen with calculated number"""
+    def init_result_screen(self) -> None:
+        """Initialize the result screen"""
 
-        # Create a new widget for the result screen
         result_widget = QWidget()
         layout = QVBoxLayout(result_widget)
         layout.setSpacing(30)
 
         # Add header
         header = QLabel('I know your number!')
-        header.setFont(QFont("Monospace", 24, QFont.Bold))
+        header.setFont(_monospace_font(24, bold=True))
         header.setStyleSheet(f'color: {self.COLORS["primary"]}')
         header.setAlignment(Qt.AlignCenter)
         layout.addWidget(header)
 
-        # Calculate result
-        result = self.get_result(self.answers)
-
-        # Show result
-        result_label = QLabel(result)
-        result_label.setFont(QFont("Monospace", 72, QFont.Bold))
-        result_label.setStyleSheet(f"""
+        # Show result (text is set by update_result_screen)
+        self._result_label = QLabel()
+        self._result_label.setFont(_monospace_font(72, bold=True))
+        self._result_label.setStyleSheet(f"""
             color: {self.COLORS["primary"]};
             background-color: {self.COLORS["secondary"]};
             border: 5px solid {self.COLORS["primary"]};
             border-radius: 20px;
             padding: 20px;
         """)
-        result_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(result_label)
+        self._result_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self._result_label)
 
         # Add explanation
         explanation = QLabel("How did I do it? Each card represents a binary digit.\n"
                              "Your answers created a binary number that decoded to your choice!")
-        explanation.setFont(QFont('Monospace', 12))
+        explanation.setFont(_monospace_font(12))
         explanation.setStyleSheet(f'color: {self.COLORS["accent"]}')
         explanation.setAlignment(Qt.AlignCenter)
         layout.addWidget(explanation)
@@ -412,12 +382,57 @@ class GuessTheNumberGame(QMainWindow):
 
         layout.addLayout(button_layout)
 
-        # Replace the existing result screen with the new one
-        old_widget = self.stacked_widget.widget(self.RESULT)
-        self.stacked_widget.removeWidget(old_widget)
-        old_widget.deleteLater()
+        self.stacked_widget.addWidget(result_widget)
+
+    def start_game(self) -> None:
+        """Start a new game"""
+
+        # Reset game state
+        self.answers: str = ''
+        self.card_num: int = 0
+
+        # Show introduction screen
+        self.stacked_widget.setCurrentIndex(self.INTRODUCTION)
+
+    def update_game_screen(self) -> None:
+        """Flip the game screen to the current card and update the progress indicator"""
+
+        self._progress_label.setText(f"Card {self.card_num + 1} of 6")
+        self.game_stack.setCurrentIndex(self.card_num)
+        self.stacked_widget.setCurrentIndex(self.GAME)
 
-        self.stacked_widget.insertWidget(self.RESULT, result_widget)
+    def show_next_card(self) -> None:
+        """Show the next card of numbers"""
+
+        # Check if we have shown all cards
+        if self.card_num >= 6:
+            self.update_result_screen()
+            self.stacked_widget.setCurrentIndex(self.RESULT)
+            return
+
+        # Update the game screen with current card
+        self.update_game_screen()
+
+    def process_answer(self, answer: int) -> None:
+        """Process the user's answer"""
+
+        # Add answer to binary string
+        self.answers += answer
+        self.card_num += 1
+
+        # Show transition effect with proper timer
+        self.centralWidget().setEnabled(False)
+        QTimer.singleShot(50, self._resume_after_answer)
+
+    def _resume_after_answer(self) -> None:
+        """Re-enable the window and move on once the transition delay is over"""
+
+        self.centralWidget().setEnabled(True)
+        self.show_next_card()
+
+    def update_result_screen(self) -> None:
+        """Update the result screen with calculated number"""
+        self._result_label.setText(self.get_result(self.answers))
 
     def go_to_main_menu(self) -> None:
         """Go back to the main menu"""
@@ -426,16 +441,8 @@ class GuessTheNumberGame(QMainWindow):
     @staticmethod
     def get_result(binary_string) -> str:
         """Convert binary answer string to decimal"""
-        # Reverse the binary string to match positional value
-        binary_string = binary_string[::+1]
-
-        # Calculate decimal value
-        decimal: int = 0
-        for i, bit in enumerate(binary_string):
-            if bit == '1':
-                decimal += 2 ** i
-
-        return str(decimal)
+        # Answers are stored least significant bit first, so reverse before parsing
+        return str(int(binary_string[::-1], 2))
 
 
 def main() -> None: